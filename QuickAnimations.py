@@ -6,15 +6,13 @@ Downloads Python embeddable + creates venv + installs Manim automatically.
 
 import sys
 import os
-import tempfile
 import subprocess
 import threading
-import urllib.request
-import zipfile
+import collections
+import time
 import shutil
-import json
+import functools
 import tkinter as tk
-from tkinter import filedialog
 from pathlib import Path
 
 
@@ -37,6 +35,35 @@ C = {
     "text_muted":   "#55556a",
 }
 
+# Label styles, passed at construction so each label is a single Tcl command
+ROLES = {
+    "title":    dict(font=("Segoe UI Semibold", 18), bg=C["bg"], fg=C["text"]),
+    "subtitle": dict(font=("Segoe UI", 9), bg=C["bg"], fg=C["text_dim"]),
+    "header":   dict(font=("Segoe UI Semibold", 11), bg=C["surface"], fg=C["text"]),
+    "field":    dict(font=("Segoe UI", 10), bg=C["surface"], fg=C["text_dim"],
+                     width=12, anchor="w"),
+    "hint":     dict(font=("Segoe UI", 8), bg=C["surface"], fg=C["text_muted"]),
+    "status":   dict(font=("Segoe UI", 9), bg=C["bg"], fg=C["text_dim"], anchor="w"),
+    "footer":   dict(font=("Segoe UI", 8), bg=C["bg"], fg=C["text_muted"]),
+}
+
+# Option-database defaults for the settings dropdowns (tk.OptionMenu and its
+# menu); applied once instead of a .config() on every menu. Relief, border and
+# highlight are passed explicitly by tk.OptionMenu, so _option_menu sets those.
+MENU_OPTIONS = {
+    "*Menubutton.background":       C["surface2"],
+    "*Menubutton.foreground":       C["text"],
+    "*Menubutton.font":             "{Segoe UI} 10",
+    "*Menubutton.activeBackground": C["surface3"],
+    "*Menubutton.activeForeground": C["text"],
+    "*Menu.background":             C["surface2"],
+    "*Menu.foreground":             C["text"],
+    "*Menu.activeBackground":       C["accent"],
+    "*Menu.activeForeground":       "#fff",
+    "*Menu.font":                   "{Segoe UI} 10",
+    "*Menu.borderWidth":            0,
+}
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 APP_DIR = os.path.join(os.path.expanduser("~"), ".quickanimations")
 VENV_DIR = os.path.join(APP_DIR, "venv")
@@ -44,23 +71,244 @@ PYTHON_EMBED_DIR = os.path.join(APP_DIR, "python")
 PYTHON_EXE = os.path.join(VENV_DIR, "Scripts", "python.exe")
 PIP_EXE = os.path.join(VENV_DIR, "Scripts", "pip.exe")
 SETUP_MARKER = os.path.join(APP_DIR, "setup_complete.json")
+SYSPY_CACHE = os.path.join(APP_DIR, "syspy.json")
+# manim config passed via --config_file; only written when manim has to use
+# the ffmpeg bundled with imageio-ffmpeg
+MANIM_CFG = os.path.join(APP_DIR, "manim.cfg")
+# Committed scene file; PyInstaller builds unpack bundled data to _MEIPASS
+SCENE_SCRIPT = os.path.join(
+    getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))),
+    "_logo_scene.py"
+)
+DESKTOP = os.path.join(os.path.expanduser("~"), "Desktop")   # render output
+RENDER_CACHE_DIR = os.path.join(APP_DIR, "render_cache")
+RENDER_CACHE_MAX = 20   # videos kept; least recently used are evicted
 
 PYTHON_VERSION = "3.11.9"
-PYTHON_EMBED_URL = f"https://www.python.org/ftp/python/{PYTHON_VERSION}/python-{PYTHON_VERSION}-embed-amd64.zip"
+MANIM_VERSION = "0.18.1"
+MANIM_PYTHONS = (9, 12)   # 3.x minors allowed by manim 0.18.1's Requires-Python
+PBS_RELEASE = "20240415"
+PYTHON_STANDALONE_URL = (
+    "https://github.com/astral-sh/python-build-standalone/releases/download/"
+    f"{PBS_RELEASE}/cpython-{PYTHON_VERSION}%2B{PBS_RELEASE}"
+    "-x86_64-pc-windows-msvc-shared-install_only.tar.gz"
+)
 GET_PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
 
 
 # ─── Dependency Checker ──────────────────────────────────────────────────────
+MARKER_MAX_AGE = 7 * 24 * 3600   # re-probe manim at least once a week
+
+# Runs inside the target interpreter: imports manim once, then answers one
+# JSON request per stdin line. The real stdout is kept for replies; anything
+# manim prints is redirected to stderr.
+HELPER_SRC = r"""
+import json, os, sys
+_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+os.dup2(2, 1)
+
+def reply(**msg):
+    _out.write(json.dumps(msg) + "\n")
+    _out.flush()
+
+try:
+    import manim
+except Exception as e:
+    reply(ok=False, error=repr(e))
+    sys.exit(1)
+manim_dir = os.path.dirname(manim.__file__)
+reply(ok=True, manim_dir=manim_dir)
+
+
+_scenes = {}
+
+
+def load_scene(path):
+    # Import the scene file once per helper lifetime (again if it is edited,
+    # since the app's render cache key covers its contents)
+    key = (path, os.path.getmtime(path))
+    if key not in _scenes:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("_logo_scene", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scenes[key] = module.LogoAnimation
+    return _scenes[key]
+
+
+def render(scene, svg, name, width, height, fps, output, ffmpeg=None):
+    from manim import tempconfig
+
+    LogoAnimation = load_scene(scene)
+    os.environ["QA_SVG"] = svg
+    os.environ["QA_NAME"] = name
+
+    # manim 0.18 pipes raw RGBA frames over stdin into an ffmpeg subprocess
+    # (no PNGs, no per-frame disk I/O), which encodes them alongside cairo;
+    # what is left to skip is the per-animation hashing for its partial-movie
+    # cache, which the app's own render cache makes redundant
+    cfg = {"pixel_width": width, "pixel_height": height,
+           "frame_rate": fps, "output_file": output,
+           "renderer": "cairo", "write_to_movie": True,
+           "disable_caching": True}
+    if ffmpeg:
+        cfg["ffmpeg_executable"] = ffmpeg
+    with tempconfig(cfg):
+        LogoAnimation().render()
+
+
+for line in sys.stdin:
+    try:
+        req = json.loads(line)
+        if req["cmd"] == "ping":
+            reply(ok=True, manim_dir=manim_dir)
+        elif req["cmd"] == "render":
+            render(req["scene"], req["svg"], req["name"], req["width"],
+                   req["height"], req["fps"], req["output"], req.get("ffmpeg"))
+            reply(ok=True)
+        else:
+            reply(ok=False, error="unknown command: " + req["cmd"])
+    except Exception as e:
+        reply(ok=False, error=repr(e))
+"""
+
+
+class ManimHelper:
+    """Long-lived interpreter with manim already imported.
+
+    Pays the interpreter + manim import cost once; every later request is a
+    line of JSON over its stdin/stdout pipes.
+    """
+
+    def __init__(self, python_exe, timeout=15):
+        self.python_exe = python_exe
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            [python_exe, "-u", "-c", HELPER_SRC],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, encoding="utf-8",
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        hello = self._read(timeout)
+        if not hello.get("ok"):
+            self.close()
+            raise RuntimeError(hello.get("error", "manim import edilemedi"))
+        self.manim_dir = hello["manim_dir"]
+
+    def _read(self, timeout):
+        import json
+        # readline() has no timeout of its own — kill the process to unblock it
+        timer = threading.Timer(timeout, self._proc.kill) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            line = self._proc.stdout.readline()
+        finally:
+            if timer:
+                timer.cancel()
+        if not line:
+            raise RuntimeError("manim import edilemedi")
+        return json.loads(line)
+
+    def request(self, cmd, timeout=None, **args):
+        import json
+        with self._lock:
+            self._proc.stdin.write(json.dumps({"cmd": cmd, **args}) + "\n")
+            self._proc.stdin.flush()
+            reply = self._read(timeout)
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error", "Bilinmeyen hata"))
+        return reply
+
+    def alive(self):
+        return self._proc.poll() is None
+
+    def close(self):
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        self._proc.kill()
+
+
+_helper = None
+_helper_lock = threading.Lock()
+
+# Render through the warm helper; `--fallback` switches back to one
+# `python -m manim` process per render
+USE_HELPER_RENDER = True
+
+
+def get_helper(python_exe, timeout=15):
+    """Return the shared ManimHelper for python_exe, starting it if needed."""
+    global _helper
+    with _helper_lock:
+        if _helper is None or not _helper.alive() or _helper.python_exe != python_exe:
+            if _helper is not None:
+                _helper.close()
+                _helper = None
+            _helper = ManimHelper(python_exe, timeout)
+        return _helper
+
+
+def _probe_manim(python_exe, timeout=15):
+    """Import manim in the given interpreter. Returns manim's package dir."""
+    try:
+        return get_helper(python_exe, timeout).request("ping", timeout)["manim_dir"]
+    except (OSError, ValueError) as e:
+        raise RuntimeError(str(e))
+
+
+def _fingerprint(python_exe, manim_dir):
+    """mtimes that change whenever the interpreter or the manim install does."""
+    try:
+        return {
+            "python_exe_mtime": os.path.getmtime(python_exe),
+            "manim_dir": manim_dir,
+            "manim_dir_mtime": os.path.getmtime(manim_dir),
+        }
+    except OSError:
+        return {}
+
+
+def _read_marker():
+    """Parse the key=value setup marker into a dict of strings."""
+    with open(SETUP_MARKER, "r", encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("{"):
+        # Marker written by an older version — values are re-stringified so
+        # callers see one format; the next write upgrades the file
+        import json
+        return {k: str(v) for k, v in json.loads(text).items()}
+    return dict(line.split("=", 1) for line in text.splitlines() if "=" in line)
+
+
+def write_setup_marker(python_exe, manim_dir, **extra):
+    """Persist the validated environment together with its fingerprint."""
+    marker = {"marker_v": 1}
+    marker.update(extra)
+    marker["python_exe"] = python_exe
+    marker.update(_fingerprint(python_exe, manim_dir))
+    marker["validated_at"] = time.time()
+    os.makedirs(APP_DIR, exist_ok=True)
+    with open(SETUP_MARKER, "w", encoding="utf-8") as f:
+        f.write("".join(f"{k}={v}\n" for k, v in marker.items()))
+    is_setup_complete.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def is_setup_complete():
-    """Check if the environment is fully configured. Loads custom paths from marker."""
+    """Check if the environment is fully configured. Loads custom paths from marker.
+
+    Memoized for the process; write_setup_marker() clears the cache."""
     global PYTHON_EXE
     if not os.path.isfile(SETUP_MARKER):
         return False
 
     # Load saved python path from marker
+    marker = {}
     try:
-        with open(SETUP_MARKER, "r", encoding="utf-8") as f:
-            marker = json.load(f)
+        marker = _read_marker()
         saved_exe = marker.get("python_exe", PYTHON_EXE)
         if os.path.isfile(saved_exe):
             PYTHON_EXE = saved_exe
@@ -70,55 +318,350 @@ def is_setup_complete():
     if not os.path.isfile(PYTHON_EXE):
         return False
 
-    # Quick check: can we import manim?
+    # Fast path: nothing changed since the last successful probe
+    manim_dir = marker.get("manim_dir")
+    if manim_dir and marker.get("python_exe") == PYTHON_EXE:
+        current = _fingerprint(PYTHON_EXE, manim_dir)
+        try:
+            fresh = time.time() - float(marker.get("validated_at", 0)) < MARKER_MAX_AGE
+        except ValueError:
+            fresh = False
+        if fresh and current and all(marker.get(k) == str(v) for k, v in current.items()):
+            return True
+
+    # Slow path: can we import manim?
+    try:
+        manim_dir = _probe_manim(PYTHON_EXE)
+    except Exception:
+        return False
+
+    # Refresh the fingerprint so the next launch takes the fast path
+    try:
+        extra = {k: v for k, v in marker.items()
+                 if k in ("python_version", "venv_dir", "skipped_setup")}
+        write_setup_marker(PYTHON_EXE, manim_dir, **extra)
+    except OSError:
+        pass
+    return True
+
+
+def _python_candidates():
+    """Yield interpreter paths lazily — PATH hits first, then common install dirs."""
+    for name in ("python", "python3", "py"):
+        yield shutil.which(name)
+    for ver in ["311", "312", "310", "39"]:
+        yield os.path.join(
+            os.environ.get("LOCALAPPDATA", ""), f"Programs\\Python\\Python{ver}\\python.exe"
+        )
+        yield os.path.join(f"C:\\Python{ver}\\python.exe")
+
+
+def _supported_version(ver_str):
+    """True for a 'Python 3.x.y' banner that the pinned manim installs on."""
+    if not ver_str.startswith("Python 3."):
+        return False
+    try:
+        minor = int(ver_str.split(".")[1])
+    except (IndexError, ValueError):
+        return False
+    return MANIM_PYTHONS[0] <= minor <= MANIM_PYTHONS[1]
+
+
+def _python_version(path):
+    """Return the version banner if manim can be installed on path, else None."""
     try:
         result = subprocess.run(
-            [PYTHON_EXE, "-c", "import manim; print('ok')"],
-            capture_output=True, text=True, timeout=15,
+            [path, "--version"], capture_output=True, text=True, timeout=5,
             creationflags=subprocess.CREATE_NO_WINDOW
         )
-        return result.stdout.strip() == "ok"
+        ver_str = result.stdout.strip()
+        if _supported_version(ver_str):
+            return ver_str
     except Exception:
-        return False
+        pass
+    return None
 
 
 def find_system_python():
-    """Find a working system Python 3.8+ to bootstrap the venv."""
-    candidates = [
-        shutil.which("python"),
-        shutil.which("python3"),
-        shutil.which("py"),
-    ]
-    # Also check common install locations
-    for ver in ["311", "312", "310", "39", "313"]:
-        candidates.append(os.path.join(
-            os.environ.get("LOCALAPPDATA", ""), f"Programs\\Python\\Python{ver}\\python.exe"
-        ))
-        candidates.append(os.path.join(f"C:\\Python{ver}\\python.exe"))
+    """Find a system Python in the MANIM_PYTHONS range to bootstrap the venv."""
+    import json
+
+    # Reuse the last hit as long as the executable is untouched
+    try:
+        with open(SYSPY_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        path = cached["path"]
+        if (os.path.isfile(path) and os.path.getmtime(path) == cached["mtime"]
+                and _supported_version(cached["version"])):
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
 
-    for path in candidates:
-        if path and os.path.isfile(path):
+    for path in _python_candidates():
+        if not path or not os.path.isfile(path):
+            continue
+        version = _python_version(path)
+        if version:
             try:
-                result = subprocess.run(
-                    [path, "--version"], capture_output=True, text=True, timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                ver_str = result.stdout.strip()
-                if "Python 3." in ver_str:
-                    # Extract minor version
-                    parts = ver_str.split(".")
-                    if len(parts) >= 2:
-                        minor = int(parts[1])
-                        if minor >= 8:
-                            return path
-            except Exception:
-                continue
+                os.makedirs(APP_DIR, exist_ok=True)
+                with open(SYSPY_CACHE, "w", encoding="utf-8") as f:
+                    json.dump({"path": path, "mtime": os.path.getmtime(path),
+                               "version": version}, f, indent=2)
+            except OSError:
+                pass
+            return path
+    return None
+
+
+def _is_current_interpreter(path):
+    """True if path is the Python running this script (never for the frozen .exe)."""
+    if getattr(sys, "frozen", False):
+        return False
+    try:
+        return os.path.samefile(path, sys.executable)
+    except OSError:
+        return False
+
+
+def _has_system_ffmpeg():
+    """True if an ffmpeg binary on PATH answers -version."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-version"],
+            capture_output=True, text=True, timeout=10,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def _discard_dir(path):
+    """Move a directory aside and delete it on a background thread."""
+    if not os.path.isdir(path):
+        return
+    trash = f"{path}.old-{int(time.time())}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # Rename refused (name clash, file lock) — delete in place instead
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,),
+                     kwargs={"ignore_errors": True}, daemon=True).start()
+
+
+def _sweep_trash():
+    """Delete '*.old-*' leftovers whose background delete was cut short."""
+    try:
+        names = os.listdir(APP_DIR)
+    except OSError:
+        return
+    for name in names:
+        if ".old-" in name:
+            shutil.rmtree(os.path.join(APP_DIR, name), ignore_errors=True)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# ─── Render Helpers ──────────────────────────────────────────────────────────
+QUALITY_SCALES = {"Önizleme 0.25x": 0.25, "Hızlı 0.5x": 0.5, "Tam 1.0x": 1.0}
+
+
+def _scene_env(svg_path, name):
+    """Environment for a `python -m manim SCENE_SCRIPT` run."""
+    return {**os.environ, "QA_SVG": svg_path, "QA_NAME": name}
+
+
+def _imageio_ffmpeg(python_exe):
+    """Path of the ffmpeg binary bundled with imageio-ffmpeg in python_exe's env."""
+    try:
+        result = subprocess.run(
+            [python_exe, "-c", "import imageio_ffmpeg; print(imageio_ffmpeg.get_ffmpeg_exe())"],
+            capture_output=True, text=True, timeout=30,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        path = result.stdout.strip()
+        if result.returncode == 0 and os.path.isfile(path):
+            return path
+    except (OSError, subprocess.TimeoutExpired):
+        pass
     return None
 
 
+def write_manim_cfg(ffmpeg_exe):
+    """Point manim at ffmpeg_exe. manim 0.18 pipes frames to
+    config.ffmpeg_executable ("ffmpeg" on PATH) and never asks imageio."""
+    import configparser
+
+    parser = configparser.ConfigParser()
+    # manim reads the file with BasicInterpolation — escape '%' in the path
+    parser["ffmpeg"] = {"ffmpeg_executable": ffmpeg_exe.replace("%", "%%")}
+    os.makedirs(APP_DIR, exist_ok=True)
+    with open(MANIM_CFG, "w", encoding="utf-8") as f:
+        parser.write(f)
+
+
+def _bundled_ffmpeg():
+    """The ffmpeg recorded by write_manim_cfg(), or None."""
+    import configparser
+
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(MANIM_CFG, encoding="utf-8")
+        return parser.get("ffmpeg", "ffmpeg_executable", fallback=None)
+    except configparser.Error:
+        return None
+
+
+def _config_args():
+    """Extra `python -m manim` arguments for the ffmpeg picked at setup."""
+    return ["--config_file", MANIM_CFG] if os.path.isfile(MANIM_CFG) else []
+
+
+# ─── Render Cache ────────────────────────────────────────────────────────────
+def _cache_key(svg_path, name, resolution, fps):
+    """Hash of the SVG and scene file bytes plus every setting and the
+    toolchain that change the video."""
+    import hashlib
+
+    h = hashlib.blake2b(digest_size=16)
+    for path in (svg_path, SCENE_SCRIPT):
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(b"\0")
+    h.update(f"|{name}|{resolution}|{fps}|{MANIM_VERSION}".encode("utf-8"))
+    h.update(_toolchain_id().encode("utf-8"))
+    return h.hexdigest()
+
+
+def _toolchain_id():
+    """Identity of the environment that renders: PYTHON_EXE plus mtimes of
+    its manim and site-packages dirs (any pip install/uninstall there, e.g.
+    a manim upgrade or scour appearing, touches one of them)."""
+    try:
+        manim_dir = _read_marker().get("manim_dir", "")
+    except (OSError, ValueError):
+        manim_dir = ""
+    parts = [PYTHON_EXE]
+    if manim_dir:
+        fp = _fingerprint(PYTHON_EXE, manim_dir)
+        parts += [f"{k}={v}" for k, v in sorted(fp.items())]
+        try:
+            parts.append(str(os.path.getmtime(os.path.dirname(manim_dir))))
+        except OSError:
+            pass
+    return "|" + "|".join(parts)
+
+
+def _store_render(output_path, cached):
+    """Copy a finished render into the cache and evict the oldest entries."""
+    try:
+        os.makedirs(RENDER_CACHE_DIR, exist_ok=True)
+        shutil.copyfile(output_path, cached)
+        # mtime is bumped on every hit, so it doubles as last-used time
+        # (NTFS usually has atime updates disabled)
+        entries = sorted(
+            (os.path.join(RENDER_CACHE_DIR, n) for n in os.listdir(RENDER_CACHE_DIR)),
+            key=os.path.getmtime, reverse=True
+        )
+        for stale in entries[RENDER_CACHE_MAX:]:
+            _remove_quietly(stale)
+    except OSError:
+        pass
+
+
+def want_translucency():
+    """Window alpha forces desktop compositing on every redraw — skip it when
+    QUICKANIM_OPAQUE=1 is set or over Remote Desktop, where it costs most."""
+    if os.environ.get("QUICKANIM_OPAQUE") == "1":
+        return False
+    return not os.environ.get("SESSIONNAME", "").startswith("RDP-")
+
+
+def _label(parent, text="", role="field", **kwargs):
+    """tk.Label styled by ROLES[role]; kwargs override the role."""
+    return tk.Label(parent, text=text, **{**ROLES[role], **kwargs})
+
+
+def _option_menu(parent, variable, options):
+    """Flat tk.OptionMenu; colours and fonts come from MENU_OPTIONS."""
+    menu = tk.OptionMenu(parent, variable, *options)
+    menu.config(relief="flat", borderwidth=0, highlightthickness=0)
+    return menu
+
+
+# ─── UI Thread Dispatch ──────────────────────────────────────────────────────
+class UiDispatcher:
+    """Runs callables queued by worker threads on the Tk thread.
+
+    Workers only append to a deque; the Tk thread drains it from its own
+    after() timer, so no Tcl call is ever made off the main thread. The
+    timer runs only while a thread started with spawn() is alive.
+    """
+
+    def __init__(self, root, interval=16):
+        self.root = root
+        self.interval = interval
+        self._queue = collections.deque()
+        self._workers = 0   # only touched on the Tk thread
+
+    def spawn(self, target, *args):
+        """Start target(*args) on a daemon thread (call from the Tk thread)."""
+        self._workers += 1
+        if self._workers == 1:
+            self.root.after(self.interval, self._drain)
+
+        def run():
+            try:
+                target(*args)
+            finally:
+                self._queue.append((self._worker_done, (), None))
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def post(self, fn, *args):
+        """Queue fn(*args) for the Tk thread without waiting for it."""
+        self._queue.append((fn, args, None))
+
+    def call(self, fn, *args):
+        """Queue fn(*args) and wait until the Tk thread has run it."""
+        done = threading.Event()
+        self._queue.append((fn, args, done))
+        done.wait()
+
+    def _worker_done(self):
+        self._workers -= 1
+
+    def _drain(self):
+        try:
+            while self._queue:
+                fn, args, done = self._queue.popleft()
+                try:
+                    fn(*args)
+                except Exception:
+                    # Report like any Tk callback, but keep draining: a dead
+                    # loop would leave call() waiting forever
+                    self.root.report_callback_exception(*sys.exc_info())
+                finally:
+                    if done is not None:
+                        done.set()
+        finally:
+            if self._workers:
+                self.root.after(self.interval, self._drain)
+
+
 # ─── Rounded Rectangle Helper ────────────────────────────────────────────────
-def round_rect(canvas, x1, y1, x2, y2, radius=16, **kwargs):
-    points = [
+@functools.lru_cache(maxsize=128)
+def _rect_points(x1, y1, x2, y2, radius):
+    # Widgets have fixed sizes, so the same few tuples are reused forever
+    return (
         x1 + radius, y1,
         x2 - radius, y1,
         x2, y1, x2, y1 + radius,
@@ -128,8 +671,12 @@ def round_rect(canvas, x1, y1, x2, y2, radius=16, **kwargs):
         x1, y2, x1, y2 - radius,
         x1, y1 + radius,
         x1, y1, x1 + radius, y1,
-    ]
-    return canvas.create_polygon(points, smooth=True, **kwargs)
+    )
+
+
+def round_rect(canvas, x1, y1, x2, y2, radius=16, **kwargs):
+    return canvas.create_polygon(_rect_points(x1, y1, x2, y2, radius),
+                                 smooth=True, **kwargs)
 
 
 # ─── Modern Button ───────────────────────────────────────────────────────────
@@ -151,7 +698,12 @@ class ModernButton(tk.Canvas):
         self.font_size = font_size
         self._disabled = False
 
-        self._draw(self.bg_color)
+        # Geometry never changes — build the items once, then only recolor
+        self._poly = round_rect(self, 2, 2, self.w - 2, self.h - 2,
+                                radius=self.radius, fill=self.bg_color, outline="")
+        self._text = self.create_text(self.w // 2, self.h // 2, text=self.label_text,
+                                      fill=self.fg_color,
+                                      font=("Segoe UI Semibold", self.font_size))
 
         self.bind("<Enter>", lambda e: self._on_enter())
         self.bind("<Leave>", lambda e: self._on_leave())
@@ -159,12 +711,7 @@ class ModernButton(tk.Canvas):
         self.bind("<ButtonRelease-1>", lambda e: self._on_release())
 
     def _draw(self, color):
-        self.delete("all")
-        round_rect(self, 2, 2, self.w - 2, self.h - 2,
-                   radius=self.radius, fill=color, outline="")
-        self.create_text(self.w // 2, self.h // 2, text=self.label_text,
-                         fill=self.fg_color,
-                         font=("Segoe UI Semibold", self.font_size))
+        self.itemconfig(self._poly, fill=color)
 
     def _on_enter(self):
         if not self._disabled:
@@ -194,6 +741,7 @@ class ModernButton(tk.Canvas):
         else:
             self.fg_color = "#ffffff"
             self._draw(self.bg_color)
+        self.itemconfig(self._text, fill=self.fg_color)
 
 
 # ─── Progress Bar ────────────────────────────────────────────────────────────
@@ -205,16 +753,23 @@ class GlowProgressBar(tk.Canvas):
         self.h = height
         self._progress = 0
         self._animating = False
+        self._bg_item = round_rect(self, 0, 0, self.w, self.h, radius=3,
+                                   fill=C["surface3"], outline="")
+        self._bar_item = round_rect(self, 0, 0, self.w, self.h, radius=3,
+                                    fill=C["accent"], outline="", state="hidden")
         self._draw()
 
     def _draw(self):
-        self.delete("all")
-        round_rect(self, 0, 0, self.w, self.h, radius=3,
-                   fill=C["surface3"], outline="")
-        if self._progress > 0:
-            fill_w = max(8, int(self.w * self._progress))
-            round_rect(self, 0, 0, fill_w, self.h, radius=3,
-                       fill=C["accent"], outline="")
+        fill_w = max(8, int(self.w * self._progress)) if self._progress > 0 else 0
+        self._place_bar(0, fill_w)
+
+    def _place_bar(self, x1, x2):
+        """Slide the single pre-created bar polygon instead of rebuilding it."""
+        if x2 > x1:
+            self.coords(self._bar_item, _rect_points(x1, 0, x2, self.h, 3))
+            self.itemconfig(self._bar_item, state="normal")
+        else:
+            self.itemconfig(self._bar_item, state="hidden")
 
     def set_progress(self, value):
         self._progress = max(0, min(1, value))
@@ -222,7 +777,7 @@ class GlowProgressBar(tk.Canvas):
 
     def start_indeterminate(self):
         self._animating = True
-        self._ind_pos = 0
+        self._anim_t0 = time.monotonic()
         self._animate_indeterminate()
 
     def stop_indeterminate(self):
@@ -231,19 +786,16 @@ class GlowProgressBar(tk.Canvas):
     def _animate_indeterminate(self):
         if not self._animating:
             return
-        self.delete("all")
-        round_rect(self, 0, 0, self.w, self.h, radius=3,
-                   fill=C["surface3"], outline="")
+        # Position follows wall-clock time, so a late frame jumps ahead
+        # instead of slowing the sweep down
+        pos = ((time.monotonic() - self._anim_t0) * 75) % 100
         bar_w = int(self.w * 0.3)
-        x1 = int((self.w + bar_w) * (self._ind_pos / 100)) - bar_w
+        x1 = int((self.w + bar_w) * (pos / 100)) - bar_w
         x2 = x1 + bar_w
-        x1 = max(0, x1)
-        x2 = min(self.w, x2)
-        if x2 > x1:
-            round_rect(self, x1, 0, x2, self.h, radius=3,
-                       fill=C["accent"], outline="")
-        self._ind_pos = (self._ind_pos + 1.5) % 100
-        self.after(20, self._animate_indeterminate)
+        self._place_bar(max(0, x1), min(self.w, x2))
+        # Only arm the next frame once the event loop has drained pending
+        # work, so the bar backs off while the UI is busy
+        self.after_idle(lambda: self.after(16, self._animate_indeterminate))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -258,6 +810,9 @@ class SetupScreen:
         self.frame = tk.Frame(root, bg=C["bg"])
         self.frame.pack(fill="both", expand=True)
         self._installing = False
+        self._status_text = ""
+        self._status_pending = False
+        self.ui = UiDispatcher(root)
         self._build_ui()
 
     def _build_ui(self):
@@ -299,8 +854,10 @@ class SetupScreen:
             dot = tk.Canvas(row, width=20, height=20, bg=C["surface"],
                             highlightthickness=0)
             dot.pack(side="left", padx=(0, 12))
-            # Default: gray circle
-            dot.create_oval(4, 4, 16, 16, outline=C["text_muted"], width=2, fill="")
+            # Default: gray circle; state changes only reconfigure these two items
+            oval_id = dot.create_oval(4, 4, 16, 16, outline=C["text_muted"], width=2, fill="")
+            text_id = dot.create_text(10, 10, text="", fill="#fff",
+                                      font=("Segoe UI", 8, "bold"))
 
             col = tk.Frame(row, bg=C["surface"])
             col.pack(side="left", fill="x")
@@ -311,7 +868,8 @@ class SetupScreen:
                                 bg=C["surface"], fg=C["text_muted"])
             lbl_desc.pack(anchor="w")
 
-            self.checks[key] = {"dot": dot, "title": lbl_title, "desc": lbl_desc}
+            self.checks[key] = {"dot": dot, "oval": oval_id, "mark": text_id,
+                                "title": lbl_title, "desc": lbl_desc}
 
         # ── Progress ──
         self.progress = GlowProgressBar(f, width=460, height=5)
@@ -352,33 +910,36 @@ class SetupScreen:
     # ── Checklist visual updates ──────────────────────────────────────────
     def _set_check(self, key, state):
         """state: 'pending' | 'active' | 'done' | 'error'"""
-        dot = self.checks[key]["dot"]
-        title_lbl = self.checks[key]["title"]
-        dot.delete("all")
-        if state == "pending":
-            dot.create_oval(4, 4, 16, 16, outline=C["text_muted"], width=2, fill="")
-            title_lbl.config(fg=C["text_dim"])
-        elif state == "active":
-            dot.create_oval(4, 4, 16, 16, outline=C["accent"], width=2, fill="")
-            title_lbl.config(fg=C["text"])
-        elif state == "done":
-            dot.create_oval(2, 2, 18, 18, outline="", fill=C["success"])
-            dot.create_text(10, 10, text="✓", fill="#fff",
-                            font=("Segoe UI", 8, "bold"))
-            title_lbl.config(fg=C["success"])
-        elif state == "error":
-            dot.create_oval(2, 2, 18, 18, outline="", fill=C["error"])
-            dot.create_text(10, 10, text="✗", fill="#fff",
-                            font=("Segoe UI", 8, "bold"))
-            title_lbl.config(fg=C["error"])
+        check = self.checks[key]
+        dot, oval, mark = check["dot"], check["oval"], check["mark"]
+        if state in ("pending", "active"):
+            color = C["text_muted"] if state == "pending" else C["accent"]
+            dot.coords(oval, 4, 4, 16, 16)
+            dot.itemconfig(oval, outline=color, width=2, fill="")
+            dot.itemconfig(mark, text="")
+            check["title"].config(fg=C["text_dim"] if state == "pending" else C["text"])
+        elif state in ("done", "error"):
+            color = C["success"] if state == "done" else C["error"]
+            dot.coords(oval, 2, 2, 18, 18)
+            dot.itemconfig(oval, outline="", fill=color)
+            dot.itemconfig(mark, text="✓" if state == "done" else "✗")
+            check["title"].config(fg=color)
 
     def _update_status(self, text, check_key=None, check_state=None):
-        self.root.after(0, lambda: self.status_var.set(text))
+        # Only the latest text matters — keep at most one label write queued
+        self._status_text = text
+        if not self._status_pending:
+            self._status_pending = True
+            self.ui.post(self._flush_status)
         if check_key and check_state:
-            self.root.after(0, lambda: self._set_check(check_key, check_state))
+            self.ui.post(self._set_check, check_key, check_state)
+
+    def _flush_status(self):
+        self._status_pending = False
+        self.status_var.set(self._status_text)
 
     def _update_desc(self, key, text):
-        self.root.after(0, lambda: self.checks[key]["desc"].config(text=text))
+        self.ui.post(lambda: self.checks[key]["desc"].config(text=text))
 
     # ── Skip Setup (use existing install) ───────────────────────────────────
     def _skip_setup(self):
@@ -386,6 +947,8 @@ class SetupScreen:
         if self._installing:
             return
 
+        from tkinter import filedialog   # pulls in simpledialog/messagebox
+
         chosen = filedialog.askopenfilename(
             title="Manim yüklü Python.exe dosyasını seçin",
             filetypes=[("Python", "python.exe"), ("Tüm dosyalar", "*.*")],
@@ -401,34 +964,26 @@ class SetupScreen:
 
         def validate():
             try:
-                result = subprocess.run(
-                    [chosen, "-c", "import manim; print('ok')"],
-                    capture_output=True, text=True, timeout=20,
-                    creationflags=subprocess.CREATE_NO_WINDOW
+                manim_dir = _probe_manim(chosen, timeout=20)
+
+                # Success — write marker with custom path
+                write_setup_marker(
+                    chosen, manim_dir,
+                    python_version="custom",
+                    venv_dir=os.path.dirname(os.path.dirname(chosen)),
+                    skipped_setup=True,
                 )
-                if result.stdout.strip() == "ok":
-                    # Success — write marker with custom path
-                    os.makedirs(APP_DIR, exist_ok=True)
-                    with open(SETUP_MARKER, "w", encoding="utf-8") as f:
-                        json.dump({
-                            "python_version": "custom",
-                            "venv_dir": os.path.dirname(os.path.dirname(chosen)),
-                            "python_exe": chosen,
-                            "skipped_setup": True,
-                        }, f, indent=2)
-
-                    # Update global path
-                    global PYTHON_EXE
-                    PYTHON_EXE = chosen
-
-                    self.root.after(0, lambda: self._on_skip_success(chosen))
-                else:
-                    err = result.stderr[:200] if result.stderr else "manim import edilemedi"
-                    self.root.after(0, lambda: self._on_skip_fail(err))
+
+                # Update global path
+                global PYTHON_EXE
+                PYTHON_EXE = chosen
+
+                self.ui.post(self._on_skip_success, chosen)
             except Exception as e:
-                self.root.after(0, lambda: self._on_skip_fail(str(e)))
+                err = str(e)   # `e` is unbound once the except block ends
+                self.ui.post(self._on_skip_fail, err)
 
-        threading.Thread(target=validate, daemon=True).start()
+        self.ui.spawn(validate)
 
     def _on_skip_success(self, python_path):
         for key in self.checks:
@@ -450,13 +1005,22 @@ class SetupScreen:
         self.install_btn.set_disabled(True)
         self.skip_btn.set_disabled(True)
         self.progress.start_indeterminate()
-        thread = threading.Thread(target=self._install_worker, daemon=True)
-        thread.start()
+        self.ui.spawn(self._install_worker)
 
     def _install_worker(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # I/O-bound side jobs that overlap with locating/downloading Python
+        pool = ThreadPoolExecutor(max_workers=2)
         try:
             os.makedirs(APP_DIR, exist_ok=True)
 
+            _discard_dir(VENV_DIR)
+            get_pip_path = os.path.join(APP_DIR, "get-pip.py")
+            get_pip_future = pool.submit(self._download_file, GET_PIP_URL,
+                                         get_pip_path, quiet=True)
+            ffmpeg_future = pool.submit(_has_system_ffmpeg)
+
             # ── Step 1: Find or download Python ──
             self._update_status("Python interpreter aranıyor…",
                                 "python", "active")
@@ -485,19 +1049,26 @@ class SetupScreen:
             # ── Step 2: Create venv ──
             self._update_status("Sanal ortam oluşturuluyor…", "venv", "active")
 
-            if os.path.isdir(VENV_DIR):
-                shutil.rmtree(VENV_DIR, ignore_errors=True)
-
-            result = subprocess.run(
-                [python_for_venv, "-m", "venv", VENV_DIR],
-                capture_output=True, text=True, timeout=120,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            if result.returncode != 0:
-                self._fail(f"venv oluşturulamadı: {result.stderr[:200]}", "venv")
-                return
+            venv_t0 = time.monotonic()
+            if _is_current_interpreter(python_for_venv):
+                # Same interpreter we're running in — no need to spawn it again
+                import venv
+                try:
+                    venv.EnvBuilder(with_pip=True, clear=True).create(VENV_DIR)
+                except Exception as e:
+                    self._fail(f"venv oluşturulamadı: {str(e)[:200]}", "venv")
+                    return
+            else:
+                result = subprocess.run(
+                    [python_for_venv, "-m", "venv", VENV_DIR],
+                    capture_output=True, text=True, timeout=120,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+                if result.returncode != 0:
+                    self._fail(f"venv oluşturulamadı: {result.stderr[:200]}", "venv")
+                    return
 
-            self._update_desc("venv", VENV_DIR)
+            self._update_desc("venv", f"{VENV_DIR}  ({time.monotonic() - venv_t0:.1f} sn)")
             self._update_status("Sanal ortam oluşturuldu", "venv", "done")
 
             # ── Step 3: Ensure pip ──
@@ -515,8 +1086,11 @@ class SetupScreen:
             if result.returncode != 0:
                 # Download get-pip.py and install pip
                 self._update_status("pip indiriliyor…", "pip", "active")
-                get_pip_path = os.path.join(APP_DIR, "get-pip.py")
-                self._download_file(GET_PIP_URL, get_pip_path)
+                try:
+                    get_pip_future.result()
+                except Exception:
+                    # Prefetch failed — retry in the foreground with progress
+                    self._download_file(GET_PIP_URL, get_pip_path)
                 result = subprocess.run(
                     [venv_python, get_pip_path],
                     capture_output=True, text=True, timeout=120,
@@ -525,29 +1099,32 @@ class SetupScreen:
                 if result.returncode != 0:
                     self._fail(f"pip kurulamadı: {result.stderr[:200]}", "pip")
                     return
-                try:
-                    os.remove(get_pip_path)
-                except OSError:
-                    pass
-
-            # Upgrade pip
-            subprocess.run(
-                [venv_python, "-m", "pip", "install", "--upgrade", "pip"],
-                capture_output=True, text=True, timeout=120,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
+
+            # get-pip.py was only a fallback; drop it once the prefetch settles
+            get_pip_future.add_done_callback(lambda _: _remove_quietly(get_pip_path))
 
             self._update_desc("pip", "pip hazır")
             self._update_status("pip hazır", "pip", "done")
 
-            # ── Step 4: Install Manim ──
+            # ── Step 4: Check FFmpeg (decides what goes into the pip batch) ──
+            ffmpeg_ok = ffmpeg_future.result()
+
+            # ── Step 5: Install Manim (single pip run: pip upgrade + manim + ffmpeg) ──
             self._update_status(
                 "Manim yükleniyor… (bu birkaç dakika sürebilir)",
                 "manim", "active"
             )
 
+            packages = ["pip", f"manim=={MANIM_VERSION}", "scour"]
+            if not ffmpeg_ok:
+                # No system FFmpeg — imageio-ffmpeg ships a bundled binary
+                packages.append("imageio[ffmpeg]")
+
+            # --prefer-binary: take a wheel over a newer sdist, so pycairo &
+            # co. never need a local C compiler
             result = subprocess.run(
-                [venv_python, "-m", "pip", "install", "manim"],
+                [venv_python, "-m", "pip", "install", "--upgrade",
+                 "--prefer-binary", *packages],
                 capture_output=True, text=True, timeout=600,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
@@ -555,117 +1132,68 @@ class SetupScreen:
                 self._fail(f"Manim yüklenemedi: {result.stderr[:300]}", "manim")
                 return
 
-            self._update_desc("manim", "Manim Community Edition yüklendi")
+            self._update_desc("manim", f"Manim Community Edition {MANIM_VERSION} yüklendi")
             self._update_status("Manim yüklendi", "manim", "done")
 
-            # ── Step 5: Check FFmpeg ──
             self._update_status("FFmpeg kontrol ediliyor…", "ffmpeg", "active")
-
-            ffmpeg_ok = False
-            try:
-                result = subprocess.run(
-                    [venv_python, "-c",
-                     "from manim.utils.file_ops import *; print('ok')"],
-                    capture_output=True, text=True, timeout=15,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                # Also directly check ffmpeg
-                ff_result = subprocess.run(
-                    ["ffmpeg", "-version"],
-                    capture_output=True, text=True, timeout=10,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                if ff_result.returncode == 0:
-                    ffmpeg_ok = True
-            except FileNotFoundError:
-                pass
-
-            if not ffmpeg_ok:
-                # Try to install ffmpeg via pip (imageio-ffmpeg provides it)
-                subprocess.run(
-                    [venv_python, "-m", "pip", "install", "imageio[ffmpeg]"],
-                    capture_output=True, text=True, timeout=120,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                self._update_desc("ffmpeg", "imageio-ffmpeg ile sağlandı")
-            else:
+            if ffmpeg_ok:
+                _remove_quietly(MANIM_CFG)
                 self._update_desc("ffmpeg", "Sistem FFmpeg bulundu")
+            else:
+                ffmpeg_exe = _imageio_ffmpeg(venv_python)
+                if not ffmpeg_exe:
+                    self._fail("FFmpeg bulunamadı. imageio-ffmpeg kurulamadı.",
+                               "ffmpeg")
+                    return
+                write_manim_cfg(ffmpeg_exe)
+                self._update_desc("ffmpeg", "imageio-ffmpeg ile sağlandı")
 
             self._update_status("FFmpeg hazır", "ffmpeg", "done")
 
-            # ── Done: Write marker ──
-            with open(SETUP_MARKER, "w", encoding="utf-8") as f:
-                json.dump({
-                    "python_version": PYTHON_VERSION,
-                    "venv_dir": VENV_DIR,
-                    "python_exe": PYTHON_EXE,
-                }, f, indent=2)
+            # ── Done: Verify + write marker (also warms the manim helper) ──
+            try:
+                manim_dir = _probe_manim(venv_python, timeout=60)
+            except RuntimeError as e:
+                self._fail(f"Manim yüklenemedi: {str(e)[:300]}", "manim")
+                return
 
-            self.root.after(0, self._on_install_complete)
+            write_setup_marker(
+                PYTHON_EXE, manim_dir,
+                python_version=PYTHON_VERSION,
+                venv_dir=VENV_DIR,
+            )
+
+            self.ui.post(self._on_install_complete)
 
         except Exception as e:
             self._fail(f"Beklenmeyen hata: {str(e)[:200]}")
+        finally:
+            pool.shutdown(wait=False)
 
     def _download_python(self):
-        """Download Python embeddable and use nuget/standalone installer approach.
-        Falls back to using 'py' launcher if available."""
-        try:
-            # Try using the Python nuget package (standalone, no admin needed)
-            nuget_dir = os.path.join(APP_DIR, "python_standalone")
-            os.makedirs(nuget_dir, exist_ok=True)
-
-            # Download embeddable Python
-            zip_path = os.path.join(APP_DIR, "python_embed.zip")
-            self._download_file(PYTHON_EMBED_URL, zip_path)
-
-            # Extract
-            embed_dir = os.path.join(APP_DIR, "python_embed")
-            if os.path.isdir(embed_dir):
-                shutil.rmtree(embed_dir)
-
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(embed_dir)
-
-            os.remove(zip_path)
-
-            # Embeddable Python can't create venv directly.
-            # We need to install the full Python. Let's try winget or direct MSI.
-            # Simplest approach: use the embeddable Python + get-pip to bootstrap,
-            # then install full Python via pip's python-build-standalone,
-            # or just download the installer silently.
-
-            # Actually, let's download the full Python installer and run it silently
-            installer_url = f"https://www.python.org/ftp/python/{PYTHON_VERSION}/python-{PYTHON_VERSION}-amd64.exe"
-            installer_path = os.path.join(APP_DIR, "python_installer.exe")
-
-            self._update_status("Python yükleyicisi indiriliyor…")
-            self._download_file(installer_url, installer_path)
-
-            # Install Python silently to APP_DIR/python
-            python_install_dir = os.path.join(APP_DIR, "python")
-            self._update_status("Python yükleniyor…")
-
-            result = subprocess.run(
-                [installer_path,
-                 "/quiet", "InstallAllUsers=0",
-                 f"TargetDir={python_install_dir}",
-                 "PrependPath=0",
-                 "Include_test=0",
-                 "Include_launcher=0",
-                 "Include_pip=1"],
-                capture_output=True, text=True, timeout=300,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
+        """Download a relocatable python-build-standalone build into APP_DIR/python.
 
-            try:
-                os.remove(installer_path)
-            except OSError:
-                pass
+        Plain archive extraction — no installer, no registry writes."""
+        import io
+        import tarfile
 
-            # Clean up embeddable
-            shutil.rmtree(embed_dir, ignore_errors=True)
+        try:
+            # ~30 MB archive, kept in memory instead of a temp file
+            buf = io.BytesIO()
+            self._download_stream(PYTHON_STANDALONE_URL, buf)
+            buf.seek(0)
+
+            self._update_status("Python çıkarılıyor…")
+            _discard_dir(PYTHON_EMBED_DIR)
+
+            # The archive's top-level folder is "python/"
+            with tarfile.open(fileobj=buf, mode="r:gz") as tf:
+                if hasattr(tarfile, "data_filter"):
+                    tf.extractall(APP_DIR, filter="data")
+                else:
+                    tf.extractall(APP_DIR)
 
-            python_exe = os.path.join(python_install_dir, "python.exe")
+            python_exe = os.path.join(PYTHON_EMBED_DIR, "python.exe")
             if os.path.isfile(python_exe):
                 return python_exe
 
@@ -674,8 +1202,15 @@ class SetupScreen:
         except Exception:
             return None
 
-    def _download_file(self, url, dest):
-        """Download a file with progress reporting."""
+    def _download_file(self, url, dest, quiet=False):
+        """Download a file with progress reporting (suppressed when quiet)."""
+        with open(dest, "wb") as f:
+            self._download_stream(url, f, quiet)
+
+    def _download_stream(self, url, out, quiet=False):
+        """Download into any writable binary file object."""
+        import urllib.request
+
         try:
             req = urllib.request.Request(url, headers={
                 "User-Agent": "QuickAnimations/1.0"
@@ -683,38 +1218,43 @@ class SetupScreen:
             with urllib.request.urlopen(req, timeout=120) as response:
                 total = int(response.headers.get("Content-Length", 0))
                 downloaded = 0
-                chunk_size = 65536
-
-                with open(dest, "wb") as f:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total > 0:
-                            pct = downloaded / total
-                            mb_done = downloaded / (1024 * 1024)
-                            mb_total = total / (1024 * 1024)
-                            self._update_status(
-                                f"İndiriliyor… {mb_done:.1f} / {mb_total:.1f} MB ({pct*100:.0f}%)"
-                            )
+                chunk_size = 1 << 20
+                last_ui = 0.0
+
+                while True:
+                    chunk = response.read(chunk_size)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    downloaded += len(chunk)
+                    now = time.monotonic()
+                    if total > 0 and not quiet and (now - last_ui > 0.05 or downloaded == total):
+                        last_ui = now
+                        pct = downloaded / total
+                        mb_done = downloaded / (1024 * 1024)
+                        mb_total = total / (1024 * 1024)
+                        self._update_status(
+                            f"İndiriliyor… {mb_done:.1f} / {mb_total:.1f} MB ({pct*100:.0f}%)"
+                        )
         except Exception as e:
             raise RuntimeError(f"İndirme hatası: {e}")
 
     def _fail(self, message, check_key=None):
-        if check_key:
-            self.root.after(0, lambda: self._set_check(check_key, "error"))
-        self.root.after(0, lambda: self.progress.stop_indeterminate())
-        self.root.after(0, lambda: self.progress.set_progress(0))
-        self.root.after(0, lambda: self.status_var.set(f"❌  {message}"))
-        self.root.after(0, lambda: self.install_btn.set_disabled(False))
+        def show_failure():
+            if check_key:
+                self._set_check(check_key, "error")
+            self.progress.stop_indeterminate()
+            self.progress.set_progress(0)
+            self.install_btn.set_disabled(False)
+
+        self._update_status(f"❌  {message}")
+        self.ui.post(show_failure)
         self._installing = False
 
     def _on_install_complete(self):
         self.progress.stop_indeterminate()
         self.progress.set_progress(1.0)
-        self.status_var.set("✅  Kurulum tamamlandı! Uygulama başlatılıyor…")
+        self._update_status("✅  Kurulum tamamlandı! Uygulama başlatılıyor…")
         self.root.after(1500, self._transition)
 
     def _transition(self):
@@ -739,16 +1279,33 @@ class QuickAnimationsApp:
             sx = (self.root.winfo_screenwidth() - win_w) // 2
             sy = (self.root.winfo_screenheight() - win_h) // 2
             self.root.geometry(f"{win_w}x{win_h}+{sx}+{sy}")
-            self.root.attributes("-alpha", 0.97)
+            if want_translucency():
+                self.root.attributes("-alpha", 0.97)
 
         self.svg_path = tk.StringVar(value="")
         self.status_text = tk.StringVar(value="Bir SVG dosyası seçerek başlayın")
         self.is_processing = False
+        self._toast = None   # built on the first successful render
+
+        for pattern, value in MENU_OPTIONS.items():
+            self.root.option_add(pattern, value)
+
+        self.ui = UiDispatcher(self.root)
 
         self.main_frame = tk.Frame(self.root, bg=C["bg"])
         self.main_frame.pack(fill="both", expand=True)
         self._build_ui()
 
+        if USE_HELPER_RENDER:
+            # Import manim while the user is still picking a file
+            threading.Thread(target=self._warm_helper, daemon=True).start()
+
+    def _warm_helper(self):
+        try:
+            get_helper(PYTHON_EXE, timeout=60)
+        except (OSError, ValueError, RuntimeError):
+            pass   # _render_worker falls back to the subprocess path
+
     def _build_ui(self):
         f = self.main_frame
 
@@ -761,12 +1318,9 @@ class QuickAnimationsApp:
                  bg=C["bg"], fg=C["accent"]).pack(side="left")
         title_col = tk.Frame(title_frame, bg=C["bg"])
         title_col.pack(side="left", padx=(10, 0))
-        tk.Label(title_col, text="QuickAnimations",
-                 font=("Segoe UI Semibold", 18), bg=C["bg"],
-                 fg=C["text"]).pack(anchor="w")
-        tk.Label(title_col, text="SVG → Manim MP4 · Hızlı animasyon aracı",
-                 font=("Segoe UI", 9), bg=C["bg"],
-                 fg=C["text_dim"]).pack(anchor="w")
+        _label(title_col, "QuickAnimations", "title").pack(anchor="w")
+        _label(title_col, "SVG → Manim MP4 · Hızlı animasyon aracı",
+               "subtitle").pack(anchor="w")
 
         # ── Separator ────────────────────────────────────────────────────
         sep = tk.Canvas(f, height=1, bg=C["bg"], highlightthickness=0)
@@ -784,21 +1338,23 @@ class QuickAnimationsApp:
                                   bg=C["surface"], fg=C["accent"])
         self.drop_icon.pack(pady=(10, 4))
 
-        self.drop_label = tk.Label(self.drop_frame,
-                                   text="SVG dosyası seçmek için tıklayın",
-                                   font=("Segoe UI", 11), bg=C["surface"],
-                                   fg=C["text_dim"])
+        self.drop_label = _label(self.drop_frame,
+                                 "SVG dosyası seçmek için tıklayın", "field",
+                                 font=("Segoe UI", 11), width=0, anchor="center")
         self.drop_label.pack()
 
-        self.file_label = tk.Label(self.drop_frame, text="",
-                                   font=("Segoe UI", 9), bg=C["surface"],
-                                   fg=C["text_muted"], wraplength=450)
+        self.file_label = _label(self.drop_frame, "", "hint",
+                                 font=("Segoe UI", 9), wraplength=450)
         self.file_label.pack(pady=(4, 4))
 
+        # One binding set shared by all four widgets via a bindtag; the cursor
+        # only shows while hovering anyway, so it is set once here
         for widget in [self.drop_frame, self.drop_icon, self.drop_label, self.file_label]:
-            widget.bind("<Button-1>", lambda e: self._browse_file())
-            widget.bind("<Enter>", lambda e: self._drop_hover(True))
-            widget.bind("<Leave>", lambda e: self._drop_hover(False))
+            widget.bindtags(("dropzone",) + widget.bindtags())
+            widget.config(cursor="hand2")
+        self.root.bind_class("dropzone", "<Button-1>", lambda e: self._browse_file())
+        self.root.bind_class("dropzone", "<Enter>", lambda e: self._drop_hover(True))
+        self.root.bind_class("dropzone", "<Leave>", lambda e: self._drop_hover(False))
 
         # ── Settings Card ────────────────────────────────────────────────
         settings_card = tk.Frame(f, bg=C["surface"],
@@ -808,50 +1364,39 @@ class QuickAnimationsApp:
 
         settings_header = tk.Frame(settings_card, bg=C["surface"])
         settings_header.pack(fill="x", padx=16, pady=(12, 8))
-        tk.Label(settings_header, text="⚙️  Ayarlar",
-                 font=("Segoe UI Semibold", 11),
-                 bg=C["surface"], fg=C["text"]).pack(anchor="w")
+        _label(settings_header, "⚙️  Ayarlar", "header").pack(anchor="w")
 
         # Resolution
         row1 = tk.Frame(settings_card, bg=C["surface"])
         row1.pack(fill="x", padx=16, pady=(0, 6))
-        tk.Label(row1, text="Çözünürlük", font=("Segoe UI", 10),
-                 bg=C["surface"], fg=C["text_dim"], width=12,
-                 anchor="w").pack(side="left")
+        _label(row1, "Çözünürlük").pack(side="left")
         self.res_var = tk.StringVar(value="3840x2160 (4K)")
         res_options = ["1920x1080 (Full HD)", "2560x1440 (2K)", "3840x2160 (4K)"]
-        self.res_menu = tk.OptionMenu(row1, self.res_var, *res_options)
-        self.res_menu.config(bg=C["surface2"], fg=C["text"],
-                             font=("Segoe UI", 10),
-                             highlightthickness=0, relief="flat",
-                             activebackground=C["surface3"],
-                             activeforeground=C["text"], borderwidth=0)
-        self.res_menu["menu"].config(bg=C["surface2"], fg=C["text"],
-                                     activebackground=C["accent"],
-                                     activeforeground="#fff",
-                                     font=("Segoe UI", 10), borderwidth=0)
+        self.res_menu = _option_menu(row1, self.res_var, res_options)
         self.res_menu.pack(side="right")
 
         # FPS
         row2 = tk.Frame(settings_card, bg=C["surface"])
-        row2.pack(fill="x", padx=16, pady=(0, 12))
-        tk.Label(row2, text="FPS", font=("Segoe UI", 10),
-                 bg=C["surface"], fg=C["text_dim"], width=12,
-                 anchor="w").pack(side="left")
+        row2.pack(fill="x", padx=16, pady=(0, 6))
+        _label(row2, "FPS").pack(side="left")
         self.fps_var = tk.StringVar(value="60")
         fps_options = ["24", "30", "60"]
-        self.fps_menu = tk.OptionMenu(row2, self.fps_var, *fps_options)
-        self.fps_menu.config(bg=C["surface2"], fg=C["text"],
-                             font=("Segoe UI", 10),
-                             highlightthickness=0, relief="flat",
-                             activebackground=C["surface3"],
-                             activeforeground=C["text"], borderwidth=0)
-        self.fps_menu["menu"].config(bg=C["surface2"], fg=C["text"],
-                                     activebackground=C["accent"],
-                                     activeforeground="#fff",
-                                     font=("Segoe UI", 10), borderwidth=0)
+        self.fps_menu = _option_menu(row2, self.fps_var, fps_options)
         self.fps_menu.pack(side="right")
 
+        # Quality (resolution scale)
+        row_q = tk.Frame(settings_card, bg=C["surface"])
+        row_q.pack(fill="x", padx=16, pady=(0, 12))
+        _label(row_q, "Kalite").pack(side="left")
+        self.quality_var = tk.StringVar(value="Hızlı 0.5x")
+        self.quality_menu = _option_menu(row_q, self.quality_var, QUALITY_SCALES)
+        self.quality_menu.pack(side="right")
+        self.quality_hint = _label(row_q, "", "hint")
+        self.quality_hint.pack(side="right", padx=(0, 8))
+        self.quality_var.trace_add("write", self._update_quality_hint)
+        self.res_var.trace_add("write", self._update_quality_hint)
+        self._update_quality_hint()
+
         # ── Render Button ────────────────────────────────────────────────
         btn_frame = tk.Frame(f, bg=C["bg"])
         btn_frame.pack(fill="x", padx=28, pady=(20, 0))
@@ -874,38 +1419,43 @@ class QuickAnimationsApp:
         self.status_dot = tk.Canvas(status_frame, width=8, height=8,
                                     bg=C["bg"], highlightthickness=0)
         self.status_dot.pack(side="left", padx=(0, 8), pady=2)
+        # One hidden oval per status colour; _draw_dot only flips visibility
+        self._dots = {
+            color: self.status_dot.create_oval(1, 1, 7, 7, fill=color,
+                                               outline="", state="hidden")
+            for color in (C["text_muted"], C["accent"], C["success"],
+                          C["warning"], C["error"])
+        }
+        self._dot_shown = None
         self._draw_dot(C["text_muted"])
 
-        self.status_label = tk.Label(status_frame,
-                                     textvariable=self.status_text,
-                                     font=("Segoe UI", 9), bg=C["bg"],
-                                     fg=C["text_dim"], anchor="w")
+        self.status_label = _label(status_frame, role="status",
+                                   textvariable=self.status_text)
         self.status_label.pack(side="left", fill="x")
 
         # ── Footer ───────────────────────────────────────────────────────
-        footer = tk.Label(f,
-                          text="Manim Community Edition tarafından desteklenmektedir",
-                          font=("Segoe UI", 8), bg=C["bg"], fg=C["text_muted"])
+        footer = _label(f, "Manim Community Edition tarafından desteklenmektedir",
+                        "footer")
         footer.pack(side="bottom", pady=(0, 14))
 
     # ── Helpers ───────────────────────────────────────────────────────────
     def _draw_dot(self, color):
-        self.status_dot.delete("all")
-        self.status_dot.create_oval(1, 1, 7, 7, fill=color, outline="")
+        if color == self._dot_shown:
+            return
+        if self._dot_shown is not None:
+            self.status_dot.itemconfigure(self._dots[self._dot_shown], state="hidden")
+        self.status_dot.itemconfigure(self._dots[color], state="normal")
+        self._dot_shown = color
 
     def _drop_hover(self, entering):
-        if entering:
-            self.drop_frame.config(highlightbackground=C["border_hover"])
-            for w in [self.drop_frame, self.drop_icon, self.drop_label, self.file_label]:
-                w.config(cursor="hand2")
-        else:
-            self.drop_frame.config(highlightbackground=C["border"])
-            for w in [self.drop_frame, self.drop_icon, self.drop_label, self.file_label]:
-                w.config(cursor="")
+        self.drop_frame.config(
+            highlightbackground=C["border_hover"] if entering else C["border"])
 
     def _browse_file(self):
         if self.is_processing:
             return
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="SVG Dosyası Seç",
             filetypes=[("SVG dosyaları", "*.svg"), ("Tüm dosyalar", "*.*")]
@@ -926,11 +1476,24 @@ class QuickAnimationsApp:
     def _parse_resolution(self):
         val = self.res_var.get()
         if "3840" in val:
-            return "3840,2160"
+            w, h = 3840, 2160
         elif "2560" in val:
-            return "2560,1440"
+            w, h = 2560, 1440
+        else:
+            w, h = 1920, 1080
+        # Every stage (cairo fill, encode) scales with pixel count; keep even
+        # dimensions for yuv420p
+        scale = QUALITY_SCALES[self.quality_var.get()]
+        w = int(w * scale) // 2 * 2
+        h = int(h * scale) // 2 * 2
+        return f"{w},{h}"
+
+    def _update_quality_hint(self, *_):
+        if QUALITY_SCALES[self.quality_var.get()] == 1.0:
+            self.quality_hint.config(text="Tam çözünürlük", fg=C["warning"])
         else:
-            return "1920,1080"
+            w, h = self._parse_resolution().split(",")
+            self.quality_hint.config(text=f"→ {w}x{h}", fg=C["text_muted"])
 
     # ── Render Logic ──────────────────────────────────────────────────────
     def _start_render(self):
@@ -946,68 +1509,84 @@ class QuickAnimationsApp:
         self._set_status("Render başlatılıyor…", C["accent"])
         self.progress.start_indeterminate()
 
-        thread = threading.Thread(target=self._render_worker, args=(svg,),
-                                  daemon=True)
-        thread.start()
+        # Read the Tk variables here; the worker must not call into Tk
+        self.ui.spawn(self._render_worker, svg, self._parse_resolution(),
+                      self.fps_var.get())
 
-    def _render_worker(self, svg_path):
+    def _render_worker(self, svg_path, resolution, fps):
         try:
             file_name_no_ext = Path(svg_path).stem
-            temp_dir = tempfile.gettempdir()
-            script_path = os.path.join(temp_dir, "manim_temp.py")
-            output_path = os.path.join(
-                os.path.expanduser("~/Desktop"),
-                f"{file_name_no_ext}_animation.mp4"
-            )
-            svg_escaped = svg_path.replace("\\", "\\\\")
-            resolution = self._parse_resolution()
-            fps = self.fps_var.get()
-
-            python_code = (
-                "from manim import *\n"
-                "class LogoAnimation(Scene):\n"
-                "    def construct(self):\n"
-                f"        m = SVGMobject(r'{svg_escaped}').scale(1).shift(UP)\n"
-                f"        t = Text(r'{file_name_no_ext}').scale(1.5).next_to(m, DOWN)\n"
-                "        self.play(Write(m, run_time=2))\n"
-                "        self.play(Write(t, run_time=1))\n"
-                "        self.wait(2)\n"
-            )
-
-            try:
-                os.remove(script_path)
-            except FileNotFoundError:
-                pass
+            output_path = os.path.join(DESKTOP, f"{file_name_no_ext}_animation.mp4")
 
-            with open(script_path, "w", encoding="utf-8") as f:
-                f.write(python_code)
-
-            self.root.after(0, lambda: self._set_status(
-                "Manim render ediliyor… bu biraz sürebilir", C["accent"]))
-
-            command = (
-                f'"{PYTHON_EXE}" -m manim "{script_path}" LogoAnimation '
-                f'-r {resolution} -f {fps} --renderer=cairo --write_to_movie '
-                f'--output_file "{output_path}"'
+            # Same SVG + settings as an earlier render — reuse that video
+            cached = os.path.join(
+                RENDER_CACHE_DIR,
+                _cache_key(svg_path, file_name_no_ext, resolution, fps) + ".mp4"
             )
+            if os.path.isfile(cached):
+                shutil.copyfile(cached, output_path)
+                os.utime(cached)   # mark as recently used for eviction
+                self.ui.call(self._on_render_success, output_path)
+                return
 
-            result = subprocess.run(command, shell=True,
-                                    capture_output=True, text=True,
-                                    creationflags=subprocess.CREATE_NO_WINDOW)
+            # A video left over from an earlier render must not pass for this one
+            _remove_quietly(output_path)
+            self.ui.post(self._set_status,
+                         "Manim render ediliyor… bu biraz sürebilir", C["accent"])
 
-            try:
-                os.remove(script_path)
-            except FileNotFoundError:
-                pass
-
-            if os.path.isfile(output_path):
-                self.root.after(0, lambda: self._on_render_success(output_path))
+            err = None
+            rendered = False
+            if USE_HELPER_RENDER:
+                try:
+                    helper = get_helper(PYTHON_EXE, timeout=60)
+                except (OSError, ValueError, RuntimeError):
+                    helper = None
+                if helper is not None:
+                    width, height = map(int, resolution.split(","))
+                    try:
+                        helper.request("render", scene=SCENE_SCRIPT,
+                                       svg=svg_path, name=file_name_no_ext,
+                                       width=width, height=height, fps=int(fps),
+                                       output=output_path,
+                                       ffmpeg=_bundled_ffmpeg())
+                        rendered = True
+                    except (ValueError, RuntimeError) as e:
+                        # A live helper means the scene itself failed — rerunning
+                        # it in a subprocess would fail the same way
+                        if helper.alive():
+                            err = str(e)[-300:]
+
+            if not rendered and err is None:
+                err = self._render_subprocess(svg_path, file_name_no_ext,
+                                              output_path, resolution, fps)
+
+            if err is None:
+                _store_render(output_path, cached)
+                self.ui.call(self._on_render_success, output_path)
             else:
-                err = result.stderr[-300:] if result.stderr else "Bilinmeyen hata"
-                self.root.after(0, lambda: self._on_render_error(err))
+                self.ui.call(self._on_render_error, err)
 
         except Exception as e:
-            self.root.after(0, lambda: self._on_render_error(str(e)))
+            err = str(e)
+            self.ui.call(self._on_render_error, err)
+
+    def _render_subprocess(self, svg_path, file_name_no_ext, output_path,
+                           resolution, fps):
+        """One-shot `python -m manim` render (fallback when the helper is unusable).
+        Returns None on success, else the tail of manim's stderr."""
+        result = subprocess.run(
+            [PYTHON_EXE, "-m", "manim", SCENE_SCRIPT, "LogoAnimation",
+             "-r", resolution, "-f", str(fps), "--renderer=cairo",
+             "--write_to_movie", "--disable_caching", *_config_args(),
+             "--output_file", output_path],
+            env=_scene_env(svg_path, file_name_no_ext),
+            capture_output=True, text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+
+        if result.returncode == 0 and os.path.isfile(output_path):
+            return None
+        return result.stderr[-300:] if result.stderr else "Bilinmeyen hata"
 
     def _on_render_success(self, output_path):
         self.progress.stop_indeterminate()
@@ -1022,41 +1601,61 @@ class QuickAnimationsApp:
         self.progress.set_progress(0)
         self.is_processing = False
         self.render_btn.set_disabled(False)
-        self._set_status("✗  Render başarısız oldu", C["error"])
-
-    def _show_toast(self, message, file_path):
+        # Tracebacks and manim's log end with the actual error; show that line
+        lines = [ln.strip() for ln in str(error_msg).splitlines() if ln.strip()]
+        detail = lines[-1] if lines else "Bilinmeyen hata"
+        if len(detail) > 80:
+            detail = detail[:79] + "…"
+        self._set_status(f"✗  Render başarısız: {detail}", C["error"])
+
+    def _build_toast(self):
+        """Create the (hidden) success toast; later toasts just refill it."""
         toast = tk.Toplevel(self.root)
+        toast.withdraw()
         toast.overrideredirect(True)
         toast.attributes("-topmost", True)
         toast.configure(bg=C["surface"])
 
-        tw, th = 380, 100
-        sx = self.root.winfo_x() + (self.root.winfo_width() - tw) // 2
-        sy = self.root.winfo_y() + self.root.winfo_height() - th - 60
-        toast.geometry(f"{tw}x{th}+{sx}+{sy}")
-
         inner = tk.Frame(toast, bg=C["surface"],
                          highlightbackground=C["success"],
                          highlightthickness=1)
         inner.pack(fill="both", expand=True)
 
-        tk.Label(inner, text="✅  " + message,
-                 font=("Segoe UI Semibold", 10), bg=C["surface"],
-                 fg=C["success"]).pack(padx=16, pady=(14, 4), anchor="w")
-        tk.Label(inner, text=Path(file_path).name,
-                 font=("Segoe UI", 9), bg=C["surface"],
-                 fg=C["text_dim"]).pack(padx=16, anchor="w")
-
-        def open_folder():
-            os.startfile(os.path.dirname(file_path))
+        self._toast_msg = tk.Label(inner, font=("Segoe UI Semibold", 10),
+                                   bg=C["surface"], fg=C["success"])
+        self._toast_msg.pack(padx=16, pady=(14, 4), anchor="w")
+        self._toast_path = tk.Label(inner, font=("Segoe UI", 9),
+                                    bg=C["surface"], fg=C["text_dim"])
+        self._toast_path.pack(padx=16, anchor="w")
 
         link = tk.Label(inner, text="📁 Klasörü Aç",
                         font=("Segoe UI", 9),
                         bg=C["surface"], fg=C["accent"], cursor="hand2")
         link.pack(padx=16, anchor="w", pady=(2, 0))
-        link.bind("<Button-1>", lambda e: open_folder())
+        link.bind("<Button-1>",
+                  lambda e: os.startfile(os.path.dirname(self._toast_open_path)))
+
+        self._toast = toast
+        self._toast_hide_id = None
+
+    def _show_toast(self, message, file_path):
+        if self._toast is None:
+            self._build_toast()
+        toast = self._toast
+        self._toast_msg.config(text="✅  " + message)
+        self._toast_path.config(text=Path(file_path).name)
+        self._toast_open_path = file_path
+
+        tw, th = 380, 100
+        sx = self.root.winfo_x() + (self.root.winfo_width() - tw) // 2
+        sy = self.root.winfo_y() + self.root.winfo_height() - th - 60
+        toast.geometry(f"{tw}x{th}+{sx}+{sy}")
+        toast.deiconify()
 
-        toast.after(5000, toast.destroy)
+        # A new render restarts the 5 s timer instead of being cut short
+        if self._toast_hide_id is not None:
+            toast.after_cancel(self._toast_hide_id)
+        self._toast_hide_id = toast.after(5000, toast.withdraw)
 
     def run(self):
         self.root.mainloop()
@@ -1066,6 +1665,13 @@ class QuickAnimationsApp:
 #  ENTRY POINT — Auto-detects environment and shows Setup or Main screen
 # ═══════════════════════════════════════════════════════════════════════════════
 def main():
+    global USE_HELPER_RENDER
+    threading.Thread(target=_sweep_trash, daemon=True).start()
+
+    if "--fallback" in sys.argv:
+        sys.argv.remove("--fallback")
+        USE_HELPER_RENDER = False
+
     if len(sys.argv) > 1:
         # CLI mode — skip GUI
         arg = sys.argv[1]
@@ -1079,7 +1685,8 @@ def main():
             sx = (root.winfo_screenwidth() - win_w) // 2
             sy = (root.winfo_screenheight() - win_h) // 2
             root.geometry(f"{win_w}x{win_h}+{sx}+{sy}")
-            root.attributes("-alpha", 0.97)
+            if want_translucency():
+                root.attributes("-alpha", 0.97)
             SetupScreen(root, lambda: _launch_main_in_root(root))
             root.mainloop()
         elif arg == "--cli":
@@ -1099,13 +1706,23 @@ def main():
         sx = (root.winfo_screenwidth() - win_w) // 2
         sy = (root.winfo_screenheight() - win_h) // 2
         root.geometry(f"{win_w}x{win_h}+{sx}+{sy}")
-        root.attributes("-alpha", 0.97)
+        if want_translucency():
+            root.attributes("-alpha", 0.97)
 
-        if is_setup_complete():
-            QuickAnimationsApp(root)
-        else:
-            SetupScreen(root, lambda: _launch_main_in_root(root))
+        # The setup check may have to start the venv's Python to import manim;
+        # run it off the Tk thread so the window paints right away
+        splash = _label(root, "Yükleniyor…", "subtitle", font=("Segoe UI", 11))
+        splash.place(relx=0.5, rely=0.5, anchor="center")
+        ui = UiDispatcher(root)
+
+        def show_screen(ready):
+            splash.destroy()
+            if ready:
+                QuickAnimationsApp(root)
+            else:
+                SetupScreen(root, lambda: _launch_main_in_root(root))
 
+        ui.spawn(lambda: ui.post(show_screen, is_setup_complete()))
         root.mainloop()
 
 
@@ -1125,45 +1742,18 @@ def _process_svg_cli(svg_path):
         return
 
     file_name_no_ext = Path(svg_path).stem
-    temp_dir = tempfile.gettempdir()
-    script_path = os.path.join(temp_dir, "manim_temp.py")
-    output_path = os.path.join(
-        os.path.expanduser("~/Desktop"),
-        f"{file_name_no_ext}_animation.mp4"
-    )
-    svg_escaped = svg_path.replace("\\", "\\\\")
-
-    python_code = (
-        "from manim import *\n"
-        "class LogoAnimation(Scene):\n"
-        "    def construct(self):\n"
-        f"        m = SVGMobject(r'{svg_escaped}').scale(1).shift(UP)\n"
-        f"        t = Text(r'{file_name_no_ext}').scale(1.5).next_to(m, DOWN)\n"
-        "        self.play(Write(m, run_time=2))\n"
-        "        self.play(Write(t, run_time=1))\n"
-        "        self.wait(2)\n"
+    output_path = os.path.join(DESKTOP, f"{file_name_no_ext}_animation.mp4")
+
+    _remove_quietly(output_path)
+    result = subprocess.run(
+        [PYTHON_EXE, "-m", "manim", SCENE_SCRIPT, "LogoAnimation",
+         "-r", "3840,2160", "-f", "60", "--renderer=cairo", "--write_to_movie",
+         "--disable_caching", *_config_args(), "--output_file", output_path],
+        env=_scene_env(svg_path, file_name_no_ext),
+        creationflags=subprocess.CREATE_NO_WINDOW
     )
 
-    try:
-        os.remove(script_path)
-    except FileNotFoundError:
-        pass
-    with open(script_path, "w", encoding="utf-8") as f:
-        f.write(python_code)
-
-    command = (
-        f'"{PYTHON_EXE}" -m manim "{script_path}" LogoAnimation '
-        f'-r 3840,2160 -f 60 --renderer=cairo --write_to_movie '
-        f'--output_file "{output_path}"'
-    )
-    subprocess.run(command, shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
-
-    try:
-        os.remove(script_path)
-    except FileNotFoundError:
-        pass
-
-    if os.path.isfile(output_path):
+    if result.returncode == 0 and os.path.isfile(output_path):
         print(f"✓ Video oluşturuldu: {output_path}")
     else:
         print("✗ Video oluşturulamadı.")
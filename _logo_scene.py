@@ -0,0 +1,56 @@
+"""
+LogoAnimation scene rendered by QuickAnimations.
+
+Run as `python -m manim _logo_scene.py LogoAnimation ...` (or loaded by the
+render helper). The SVG path and the caption come from the QA_SVG / QA_NAME
+environment variables, so nothing user-supplied is ever pasted into code.
+"""
+
+import os
+import tempfile
+
+from manim import DOWN, UP, Scene, SVGMobject, Text, Write
+
+
+def optimize_svg(svg):
+    """Write a scour-optimized copy of svg to a temp file and return its path.
+
+    Drops editor metadata/unused ids and trims float precision, so
+    SVGMobject parses and cairo strokes fewer path commands. Returns None
+    when scour is missing or can't handle the file.
+    """
+    try:
+        from scour import scour
+    except ImportError:
+        return None
+    opts = scour.sanitizeOptions()
+    opts.digits = 4
+    opts.strip_ids = opts.shorten_ids = True
+    opts.remove_metadata = opts.strip_comments = True
+    opts.enable_viewboxing = True
+    try:
+        with open(svg, encoding="utf-8") as f:
+            text = scour.scourString(f.read(), opts)
+    except Exception:
+        return None
+    fd, out = tempfile.mkstemp(prefix="qa_", suffix=".svg")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    return out
+
+
+class LogoAnimation(Scene):
+    def construct(self):
+        svg = os.environ["QA_SVG"]
+        optimized = optimize_svg(svg)
+        try:
+            # manim's SVG cache is keyed by file name only; the render helper
+            # outlives edits to the file, so always parse it afresh
+            m = SVGMobject(optimized or svg, use_svg_cache=False).scale(1).shift(UP)
+        finally:
+            if optimized:
+                os.remove(optimized)
+        t = Text(os.environ["QA_NAME"]).scale(1.5).next_to(m, DOWN)
+        self.play(Write(m, run_time=2))
+        self.play(Write(t, run_time=1))
+        self.wait(2)